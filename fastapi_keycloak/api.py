@@ -1,19 +1,39 @@
 from __future__ import annotations
 
+import asyncio
 import functools
-import json
-from datetime import datetime
+import hashlib
+import inspect
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from json import JSONDecodeError
-from typing import Any, Callable, List, Type, Union
-from urllib.parse import urlencode
+from typing import Any, Callable, List, MutableMapping, Type, Union
+from urllib.parse import quote, quote_plus, urlencode
 
+import httpx
+import orjson
 import requests
+from cachetools import TTLCache
 from fastapi import Depends, FastAPI, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import ExpiredSignatureError, JWTError, jwt
-from jose.exceptions import JWTClaimsError
+from jose import ExpiredSignatureError, JWTError, jwk, jwt
+from jose.backends.base import Key
+from jose.backends.cryptography_backend import CryptographyRSAKey
+from jose.constants import ALGORITHMS
+from jose.exceptions import JOSEError, JWTClaimsError
 from pydantic import BaseModel
 from requests import Response
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:  # pydantic v2 validates whole payloads, lists included, in compiled code
+    from pydantic import TypeAdapter
+except ImportError:  # pydantic v1
+    TypeAdapter = None
 
 from fastapi_keycloak.exceptions import (
     ConfigureTOTPException,
@@ -36,6 +56,142 @@ from fastapi_keycloak.model import (
 )
 
 ALLOWED_QUERY_FIELDS = {"email", "username", "firstName", "lastName"}
+_QUERY_FIELD_PATTERN = "(?:" + "|".join(sorted(ALLOWED_QUERY_FIELDS)) + ")=[^&]+"
+_QUERY_RE = re.compile(f"{_QUERY_FIELD_PATTERN}(?:&{_QUERY_FIELD_PATTERN})*")
+JWT_CACHE_TTL = 30  # Upper bound in seconds a verified token payload is reused
+RETRY_STATUS_CODES = (502, 503, 504)
+JWKS_CACHE_TTL = 3600  # Seconds the signing keys of the realm are cached
+JWKS_REFRESH_INTERVAL = 30  # Minimum seconds between two fetches of the signing keys
+# Seconds before its expiry the admin token is no longer trusted blindly
+ADMIN_TOKEN_EXPIRY_MARGIN = 30
+# Seconds the realm representation is reused, e.g. for the session limit
+REALM_SETTINGS_CACHE_TTL = 30
+BULK_CONCURRENCY = 32  # Maximum number of admin requests a bulk operation has in flight at the same time
+# Connections kept per host, also the number of requests the executor may have in flight
+HTTP_POOL_MAXSIZE = 64
+FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+# Login failures caused by a pending required action, only the matching exception is instantiated
+_REQUIRED_ACTION_EXCEPTIONS = {
+    "update_user_locale": UpdateUserLocaleException,
+    "CONFIGURE_TOTP": ConfigureTOTPException,
+    "VERIFY_EMAIL": VerifyEmailException,
+    "UPDATE_PASSWORD": UpdatePasswordException,
+    "UPDATE_PROFILE": UpdateProfileException,
+}
+
+
+def _decode_content(response: Response | httpx.Response) -> Any:
+    """Returns the JSON payload of a response, or its decoded content if the payload is no JSON
+
+    Args:
+        response (Response | httpx.Response): Response of Keycloak
+
+    Returns:
+        Any: Parsed JSON payload or plain text
+    """
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError:
+        return response.content.decode("utf-8")
+
+
+def _encode_body(data: Any, content_type: str) -> bytes | str | None:
+    """Serializes the payload of an admin request according to its content type
+
+    Args:
+        data (Any): The payload of the request
+        content_type (str): The content type of the request
+
+    Returns:
+        bytes | str | None: The request body, None if there is no payload at all
+    """
+    if data is None:  # GET and DELETE requests are sent without a body
+        return None
+    if content_type == "application/json":
+        return orjson.dumps(data)
+    if isinstance(data, dict):  # Form encoded, as requests would do it
+        return urlencode(data)
+    return data
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_expiration(value: str) -> float:
+    """Parses an ISO 8601 account expiration date into a POSIX timestamp
+
+    Args:
+        value (str): Expiration date, dates without a UTC offset are taken as UTC
+
+    Returns:
+        float: Timestamp of the expiration, comparable to `time.time()`
+
+    Raises:
+        ValueError: If the value is no valid ISO 8601 date
+    """
+    # Only a single designator, `fromisoformat` before Python 3.11 does not accept it
+    if value.endswith("Z"):
+        value = value[:-1]
+    expiration = datetime.fromisoformat(value)
+    if expiration.tzinfo is None:
+        expiration = expiration.replace(tzinfo=timezone.utc)
+    return expiration.timestamp()
+
+
+def _keycloak_error(response: Response | httpx.Response) -> KeycloakError:
+    """Returns the error to raise for an unsuccessful response, forwarding its status code and reason
+
+    Args:
+        response (Response | httpx.Response): Response of Keycloak
+
+    Returns:
+        KeycloakError: Error describing the response
+    """
+    return KeycloakError(
+        status_code=response.status_code, reason=_decode_content(response)
+    )
+
+
+def _handle_payload(result: Response | httpx.Response | Any) -> Any:
+    """Response handler of `result_or_error` when no response model is given
+
+    Args:
+        result (Response | httpx.Response | Any): Return value of the decorated method
+
+    Returns:
+        Any: The payload of a successful response, or the return value itself if it is no response
+
+    Raises:
+        KeycloakError: If the resulting response is not a successful HTTP-Code (>299)
+    """
+    if not isinstance(
+        result, (Response, httpx.Response)
+    ):  # If the object given is not a response object, directly return it.
+        return result
+    if result.status_code < 300:  # Successful
+        return _decode_content(result)
+    raise _keycloak_error(result)
+
+
+def _model_parser(
+    response_model: Type[BaseModel], is_list: bool
+) -> Callable[[Any], BaseModel | List[BaseModel]]:
+    """Returns the function that turns a JSON payload into the response model (or a list of it)
+
+    Args:
+        response_model (Type[BaseModel]): Object that should be returned based on the payload
+        is_list (bool): True if the return value should be a list of the response model provided
+
+    Returns:
+        Callable[[Any], BaseModel | List[BaseModel]]: Parser for the payload
+    """
+    if TypeAdapter is not None:  # Built once per decorated method
+        return TypeAdapter(
+            List[response_model] if is_list else response_model
+        ).validate_python
+    if is_list:
+        return lambda json_data: [
+            response_model.parse_obj(entry) for entry in json_data
+        ]
+    return response_model.parse_obj
 
 
 def result_or_error(
@@ -56,51 +212,40 @@ def result_or_error(
     Notes:
         - Keycloak sometimes returns empty payloads but describes the error in its content (byte encoded)
           which is why this function checks for JSONDecode exceptions.
+        - Coroutine functions are supported as well, their (awaited) `httpx.Response` is handled the same way.
         - Keycloak often does not expose the real error for security measures. You will most likely encounter:
           {'error': 'unknown_error'} as a result. If so, please check the logs of your Keycloak instance to get error
           details, the RestAPI doesn't provide any.
     """
 
-    def inner(f):
-        @functools.wraps(f)
-        def wrapper(*args, **kwargs):
-            def create_list(json_data: List[dict]):
-                return [response_model.parse_obj(entry) for entry in json_data]
-
-            def create_object(json_data: dict):
-                return response_model.parse_obj(json_data)
-
-            result: Response = f(*args, **kwargs)  # The actual call
+    # Everything known at decoration time is resolved here, so the per-call handler has no branches besides the
+    # response type and status checks
+    if response_model is None:  # No model given, the payload is returned as is
+        handle = _handle_payload
+    else:
+        parse = _model_parser(response_model, is_list)
 
-            if (
-                type(result) != Response
+        def handle(result: Response | httpx.Response):
+            if not isinstance(
+                result, (Response, httpx.Response)
             ):  # If the object given is not a response object, directly return it.
                 return result
+            if result.status_code < 300:  # Successful
+                return parse(orjson.loads(result.content))
+            raise _keycloak_error(result)
 
-            if result.status_code in range(100, 299):  # Successful
-                if response_model is None:  # No model given
+    def inner(f):
+        if inspect.iscoroutinefunction(f):
 
-                    try:
-                        return result.json()
-                    except JSONDecodeError:
-                        return result.content.decode("utf-8")
+            @functools.wraps(f)
+            async def async_wrapper(*args, **kwargs):
+                return handle(await f(*args, **kwargs))  # The actual call
 
-                else:  # Response model given
-                    if is_list:
-                        return create_list(result.json())
-                    else:
-                        return create_object(result.json())
+            return async_wrapper
 
-            else:  # Not Successful, forward status code and error
-                try:
-                    raise KeycloakError(
-                        status_code=result.status_code, reason=result.json()
-                    )
-                except JSONDecodeError:
-                    raise KeycloakError(
-                        status_code=result.status_code,
-                        reason=result.content.decode("utf-8"),
-                    )
+        @functools.wraps(f)
+        def wrapper(*args, **kwargs):
+            return handle(f(*args, **kwargs))  # The actual call
 
         return wrapper
 
@@ -129,6 +274,7 @@ class FastAPIKeycloak:
     """
 
     _admin_token: str
+    _admin_token_expires_at: float = 0
 
     def __init__(
         self,
@@ -141,6 +287,8 @@ class FastAPIKeycloak:
         admin_client_id: str = "admin-cli",
         scope: str = "openid profile email",
         timeout: int = 10,
+        user_cache: MutableMapping[str, KeycloakUser] = None,
+        user_cache_ttl: float = 0,
     ):
         """FastAPIKeycloak constructor
 
@@ -155,6 +303,12 @@ class FastAPIKeycloak:
             `Valid Redirect URIs` of Keycloak and should point to an endpoint that utilizes the authorization_code flow.
             timeout (int): Timeout in seconds to wait for the server
             scope (str): OIDC scope
+            user_cache (MutableMapping[str, KeycloakUser]): Mapping `get_user` caches the users looked up by ID in,
+            e.g. one backed by Redis to share the cache between workers. Entries must expire after a short TTL:
+            only updates made through this instance evict them, changes made in Keycloak or by other workers are
+            seen once the entry expired. Write paths of this class never read from it
+            user_cache_ttl (float): Seconds users looked up by ID are cached by the default in-process cache.
+            Defaults to 0, which disables caching. Ignored if a `user_cache` is given
         """
         self.server_url = server_url
         self.realm = realm
@@ -165,16 +319,124 @@ class FastAPIKeycloak:
         self.callback_uri = callback_uri
         self.timeout = timeout
         self.scope = scope
+        self._jwt_cache = TTLCache(maxsize=10000, ttl=JWT_CACHE_TTL)
+        self._jwt_cache_lock = threading.Lock()
+        self._jwks = TTLCache(maxsize=16, ttl=JWKS_CACHE_TTL)
+        self._jwks_fetched_at = 0.0
+        self._jwks_lock = threading.Lock()
+        self._realm_settings_cache: tuple[float, dict] | None = None
+        if user_cache is None and user_cache_ttl > 0:
+            user_cache = TTLCache(maxsize=1024, ttl=user_cache_ttl)
+        self._user_cache = user_cache
+        self._user_cache_lock = threading.Lock()
+        self._admin_token_lock = threading.Lock()
+        self._session = self._create_session()
+        # The endpoints never change after startup, resolve them once so every access is a plain attribute read
+        self.realm_uri = f"{self.server_url}/realms/{self.realm}"
+        self._admin_uri = f"{self.server_url}/admin/realms/{self.realm}"
+        self._open_id = f"{self.realm_uri}/protocol/openid-connect"
+        self.users_uri = self.admin_uri(resource="users")
+        self.roles_uri = self.admin_uri(resource="roles")
+        self.groups_uri = self.admin_uri(resource="groups")
+        self.providers_uri = self.admin_uri(resource="identity-provider/instances")
+        open_id_configuration = self.open_id_configuration
+        self.authorization_uri = open_id_configuration.get("authorization_endpoint")
+        self.token_uri = open_id_configuration.get("token_endpoint")
+        self.logout_uri = open_id_configuration.get("end_session_endpoint")
+        # The URL for users to login on the realm, with the client id, the callback and the scope
+        self.login_uri = f"{self.authorization_uri}?" + urlencode(
+            {
+                "scope": self.scope,
+                "response_type": "code",
+                "client_id": self.client_id,
+                "redirect_uri": self.callback_uri,
+            }
+        )
+        # The client credentials grant never changes, encode it only once
+        self._admin_token_body = urlencode(
+            {
+                "client_id": self.admin_client_id,
+                "client_secret": self.admin_client_secret,
+                "grant_type": "client_credentials",
+            }
+        ).encode()
+        # Static part of the user facing grants, only the per-call values are appended to it
+        client_form = urlencode(
+            {"client_id": self.client_id, "client_secret": self.client_secret}
+        )
+        self._password_grant_form = (
+            f"{client_form}&grant_type=password&scope={quote_plus(self.scope)}"
+        )
+        self._refresh_grant_form = f"{client_form}&grant_type=refresh_token"
+        self._authorization_code_form = f"{client_form}&grant_type=authorization_code&redirect_uri={quote_plus(self.callback_uri)}"
         self._get_admin_token()  # Requests an admin access token on startup
 
+    @functools.cached_property
+    def _aclient(self) -> httpx.AsyncClient:
+        """The asynchronous HTTP client used by the `*_async` methods. Created on first use and multiplexes
+        concurrent requests over HTTP/2 where Keycloak supports it
+
+        Returns:
+            httpx.AsyncClient: Pooled client
+        """
+        return httpx.AsyncClient(
+            http2=True,
+            timeout=self.timeout,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        )
+
+    @functools.cached_property
+    def _executor(self) -> ThreadPoolExecutor:
+        """Thread pool used to run independent Keycloak requests concurrently. Created on first use
+
+        Returns:
+            ThreadPoolExecutor: Shared executor of this instance
+
+        Notes:
+            - Callers only offload the second of two independent requests and send the first one themselves
+            - Sized like the connection pool, concurrent handlers don't queue up behind a handful of workers
+        """
+        return ThreadPoolExecutor(
+            max_workers=HTTP_POOL_MAXSIZE, thread_name_prefix="fastapi-keycloak"
+        )
+
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """Creates the HTTP session shared by all requests to Keycloak. Keeps connections alive and pooled, so the
+        TCP and TLS handshakes are only paid once per connection instead of once per request
+
+        Returns:
+            requests.Session: Session with a pooling adapter mounted for http and https
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=HTTP_POOL_MAXSIZE,
+            max_retries=Retry(
+                total=3,
+                read=False,  # Read timeouts are raised right away as `ReadTimeout`
+                backoff_factor=0.2,
+                status_forcelist=RETRY_STATUS_CODES,
+                # Idempotent verbs only, a retried POST could create a user or role twice
+                allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+                respect_retry_after_header=True,
+                raise_on_status=False,  # Let the caller handle the last response
+            ),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
     def validate_query(self, query: str) -> str:
-        # Divide el query en pares clave=valor
-        pairs = query.split("&")
-        for pair in pairs:
+        # Un solo recorrido con la expresión precompilada; los pares solo se separan para el mensaje de error
+        if _QUERY_RE.fullmatch(query):
+            return query
+        for pair in query.split("&"):
             key, _, value = pair.partition("=")
             if key not in ALLOWED_QUERY_FIELDS or not value:
                 raise ValueError(f"Invalid query field or value: {key}={value}")
-        return query
+        # Nunca se devuelve (ni None) una consulta que la expresión no aceptó
+        raise ValueError(f"Invalid query: {query}")
 
     @property
     def admin_token(self):
@@ -184,12 +446,18 @@ class FastAPIKeycloak:
             KeycloakToken: A token, valid to perform admin actions
 
         Notes:
-            - This might result in an infinite recursion if something unforeseen goes wrong
+            - As long as the token is not about to expire, this is a plain timestamp comparison
+            - Concurrent callers wait for a single refresh instead of each requesting a new token
         """
-        if self.token_is_valid(token=self._admin_token):
+        if time.time() < self._admin_token_expires_at:
+            return self._admin_token
+        with self._admin_token_lock:
+            # Another thread may have refreshed the token while this one was waiting for the lock
+            if time.time() < self._admin_token_expires_at:
+                return self._admin_token
+            # Validated by the setter, returned as is even if it lives shorter than the expiry margin
+            self._get_admin_token()
             return self._admin_token
-        self._get_admin_token()
-        return self.admin_token
 
     @admin_token.setter
     def admin_token(self, value: str):
@@ -201,7 +469,30 @@ class FastAPIKeycloak:
         Returns:
             None: Inplace method, updates the _admin_token
         """
-        decoded_token = self._decode_token(token=value)
+        self._store_admin_token(value, decoded_token=self._decode_token(token=value))
+
+    def _set_admin_token_trusted(self, value: str) -> None:
+        """Stores an admin token that was just received from the token endpoint of Keycloak, without verifying
+        its signature once more
+
+        Args:
+            value (str): An access Token
+
+        Returns:
+            None: Inplace method, updates the _admin_token
+        """
+        self._store_admin_token(value, decoded_token=jwt.get_unverified_claims(value))
+
+    def _store_admin_token(self, value: str, decoded_token: dict) -> None:
+        """Checks the access of a decoded admin token and stores it
+
+        Args:
+            value (str): An access Token
+            decoded_token (dict): The decoded claims of the token
+
+        Returns:
+            None: Inplace method, updates the _admin_token
+        """
         if not decoded_token.get("resource_access").get(
             "realm-management"
         ) or not decoded_token.get("resource_access").get("account"):
@@ -211,6 +502,38 @@ class FastAPIKeycloak:
                 and that the `Service Account Roles` contain all roles from `account` and `realm_management`"""
             )
         self._admin_token = value
+        self._admin_token_expires_at = decoded_token["exp"] - ADMIN_TOKEN_EXPIRY_MARGIN
+        self._admin_auth_headers = {"Authorization": f"Bearer {value}"}
+
+    def _admin_headers(self) -> dict:
+        """The `Authorization` header of admin requests, built once per admin token instead of once per request
+
+        Returns:
+            dict: Header of the current admin token. Shared between requests, copy it before adding headers
+        """
+        # Validates, or refreshes, the token first
+        if time.time() >= self._admin_token_expires_at:
+            self._admin_auth_headers = {"Authorization": f"Bearer {self.admin_token}"}
+        return self._admin_auth_headers
+
+    async def _admin_headers_async(self) -> dict:
+        """Asynchronous counterpart of `_admin_headers`. A token about to expire is refreshed with the
+        asynchronous client, so the event loop is never blocked by the refresh
+
+        Returns:
+            dict: Header of the current admin token. Shared between requests, copy it before adding headers
+        """
+        if time.time() >= self._admin_token_expires_at:
+            async with self._admin_token_async_lock:
+                # Another coroutine may have refreshed the token while this one was waiting for the lock
+                if time.time() >= self._admin_token_expires_at:
+                    response = await self._aclient.post(
+                        url=self.token_uri,
+                        headers=FORM_HEADERS,
+                        content=self._admin_token_body,
+                    )
+                    self._store_admin_token_response(response)
+        return self._admin_auth_headers
 
     def add_swagger_config(self, app: FastAPI):
         """Adds the client id and secret securely to the swagger ui.
@@ -305,11 +628,11 @@ class FastAPIKeycloak:
         Returns:
             dict: Open ID Configuration
         """
-        response = requests.get(
+        response = self._session.get(
             url=f"{self.realm_uri}/.well-known/openid-configuration",
             timeout=self.timeout,
         )
-        return response.json()
+        return orjson.loads(response.content)
 
     def proxy(
         self,
@@ -335,18 +658,78 @@ class FastAPIKeycloak:
         Raises:
             KeycloakError: If the resulting response is not a successful HTTP-Code (>299)
         """
-        headers = {"Authorization": f"Bearer {self.admin_token}"}
+        headers = self._admin_headers()
+        body = None
+        if payload is not None:
+            headers = {**headers, "Content-Type": "application/json"}
+            body = orjson.dumps(payload)
         if additional_headers is not None:
             headers = {**headers, **additional_headers}
 
-        return requests.request(
+        return self._session.request(
             method=method.name,
             url=f"{self.server_url}{relative_path}",
-            data=json.dumps(payload),
+            data=body,
             headers=headers,
             timeout=self.timeout,
         )
 
+    async def proxy_async(
+        self,
+        relative_path: str,
+        method: HTTPMethod,
+        additional_headers: dict = None,
+        payload: dict = None,
+    ) -> httpx.Response:
+        """Asynchronous counterpart of `proxy`. Should not be exposed under any circumstances. Grants full API admin
+        access.
+
+        Args:
+
+            relative_path (str): The relative path of the request.
+            Requests will be sent to: `[server_url]/[relative_path]`
+            method (HTTPMethod): The HTTP-verb to be used
+            additional_headers (dict): Optional headers besides the Authorization to add to the request
+            payload (dict): Optional payload to send
+
+        Returns:
+            httpx.Response: Proxied response
+        """
+        headers = await self._admin_headers_async()
+        body = None
+        if payload is not None:
+            headers = {**headers, "Content-Type": "application/json"}
+            body = orjson.dumps(payload)
+        if additional_headers is not None:
+            headers = {**headers, **additional_headers}
+
+        return await self._aclient.request(
+            method=method.name,
+            url=f"{self.server_url}{relative_path}",
+            content=body,
+            headers=headers,
+        )
+
+    async def close_async(self) -> None:
+        """Closes the connections of the asynchronous HTTP client, e.g. on application shutdown
+
+        Returns:
+            None: Inplace method
+        """
+        if "_aclient" in self.__dict__:
+            await self.__dict__.pop("_aclient").aclose()
+        # Bound to the loop it was used in
+        self.__dict__.pop("_admin_token_async_lock", None)
+
+    @functools.cached_property
+    def _admin_token_async_lock(self) -> asyncio.Lock:
+        """Serializes the refreshes of the admin token by coroutines. Created on first use, like `_aclient`
+
+        Returns:
+            asyncio.Lock: Lock of the admin token refresh
+        """
+        return asyncio.Lock()
+
     def _get_admin_token(self) -> None:
         """Exchanges client credentials (admin-cli) for an access token.
 
@@ -360,17 +743,31 @@ class FastAPIKeycloak:
         Notes:
             - Is executed on startup and may be executed again if the token validation fails
         """
-        headers = {"Content-Type": "application/x-www-form-urlencoded"}
-        data = {
-            "client_id": self.admin_client_id,
-            "client_secret": self.admin_client_secret,
-            "grant_type": "client_credentials",
-        }
-        response = requests.post(
-            url=self.token_uri, headers=headers, data=data, timeout=self.timeout
+        response = self._session.post(
+            url=self.token_uri,
+            headers=FORM_HEADERS,
+            data=self._admin_token_body,
+            timeout=self.timeout,
         )
+        self._store_admin_token_response(response)
+
+    def _store_admin_token_response(self, response: Response | httpx.Response) -> None:
+        """Stores the admin token of a response of the token endpoint to the client credentials grant
+
+        Args:
+            response (Response | httpx.Response): Response of the token endpoint
+
+        Returns:
+            None: Inplace method that updated the class attribute `_admin_token`
+
+        Raises:
+            KeycloakError: If the response does not contain an access_token
+        """
         try:
-            self.admin_token = response.json()["access_token"]
+            # Received straight from Keycloak, no need to verify its signature again
+            self._set_admin_token_trusted(
+                orjson.loads(response.content)["access_token"]
+            )
         except JSONDecodeError as e:
             raise KeycloakError(
                 reason=response.content.decode("utf-8"),
@@ -379,7 +776,7 @@ class FastAPIKeycloak:
 
         except KeyError as e:
             raise KeycloakError(
-                reason=f"The response did not contain an access_token: {response.json()}",
+                reason=f"The response did not contain an access_token: {orjson.loads(response.content)}",
                 status_code=403,
             ) from e
 
@@ -390,10 +787,82 @@ class FastAPIKeycloak:
         Returns:
             str: Public key for JWT decoding
         """
-        response = requests.get(url=self.realm_uri, timeout=self.timeout)
-        public_key = response.json()["public_key"]
+        response = self._session.get(url=self.realm_uri, timeout=self.timeout)
+        public_key = orjson.loads(response.content)["public_key"]
         return f"-----BEGIN PUBLIC KEY-----\n{public_key}\n-----END PUBLIC KEY-----"
 
+    @functools.cached_property
+    def _public_jwk(self) -> Key:
+        """Returns the Keycloak public key, parsed once into a key object
+
+        Returns:
+            Key: Public key for JWT decoding. Passing the key object to `jwt.decode` avoids parsing the PEM on
+            every single decode
+
+        Notes:
+            - Always backed by `cryptography` (OpenSSL), never by the much slower pure Python `rsa` fallback
+        """
+        return CryptographyRSAKey(self.public_key, ALGORITHMS.RS256)
+
+    def _signing_key(self, token: str) -> Key:
+        """Returns the key the token was signed with, based on the key id (`kid`) in its header. Unknown key ids,
+        e.g. after a key rotation, trigger a single fetch of the realm's signing keys
+
+        Args:
+            token (str): The token to be verified
+
+        Returns:
+            Key: Public key for JWT decoding. The realm's public key if the token has no (known) key id
+
+        Raises:
+            JWTError: If the header of the token can not be decoded or the signing keys can not be fetched
+        """
+        kid = jwt.get_unverified_header(token).get("kid")
+        if kid is None:
+            return self._public_jwk
+        with self._jwks_lock:
+            key = self._jwks.get(kid)
+            # Rate limited, so tokens with made up key ids can't make us hammer Keycloak
+            fetch = (
+                key is None
+                and time.time() - self._jwks_fetched_at > JWKS_REFRESH_INTERVAL
+            )
+            if fetch:  # Claimed, concurrent misses don't fetch again
+                self._jwks_fetched_at = time.time()
+        if fetch:
+            # Outside of the lock, a slow fetch doesn't stall the lookups of cached keys
+            keys = self._fetch_jwks()
+            with self._jwks_lock:
+                self._jwks.update(keys)
+            key = keys.get(kid)
+        return key if key is not None else self._public_jwk
+
+    def _fetch_jwks(self) -> dict:
+        """Fetches the signing keys of the realm (JWKS)
+
+        Returns:
+            dict: Signing keys by key id
+
+        Raises:
+            JWTError: If the keys can not be fetched or parsed, previously cached keys are kept
+        """
+        try:
+            response = self._session.get(
+                url=self.open_id("certs"), timeout=self.timeout
+            )
+            if response.status_code != 200:
+                raise _keycloak_error(response)
+            return {
+                key["kid"]: jwk.construct(
+                    key, algorithm=key.get("alg", ALGORITHMS.RS256)
+                )
+                for key in orjson.loads(response.content).get("keys", [])
+                if key.get("use", "sig") == "sig" and "kid" in key
+            }
+        except (requests.RequestException, KeycloakError, ValueError, JOSEError) as e:
+            # Surfaced like an invalid token, e.g. a 401 instead of a 500 for a token with an unknown key id
+            raise JWTError(f"Unable to fetch the signing keys of the realm: {e}") from e
+
     @result_or_error()
     def add_user_roles(self, roles: List[str], user_id: str) -> dict:
         """Adds roles to a specific user
@@ -411,7 +880,7 @@ class FastAPIKeycloak:
         keycloak_roles = self.get_roles(roles)
         return self._admin_request(
             url=f"{self.users_uri}/{user_id}/role-mappings/realm",
-            data=[role.__dict__ for role in keycloak_roles],
+            data=[role.dict(exclude_none=True) for role in keycloak_roles],
             method=HTTPMethod.POST,
         )
 
@@ -432,7 +901,7 @@ class FastAPIKeycloak:
         keycloak_roles = self.get_roles(roles)
         return self._admin_request(
             url=f"{self.users_uri}/{user_id}/role-mappings/realm",
-            data=[role.__dict__ for role in keycloak_roles],
+            data=[role.dict(exclude_none=True) for role in keycloak_roles],
             method=HTTPMethod.DELETE,
         )
 
@@ -455,8 +924,12 @@ class FastAPIKeycloak:
         """
         if role_names is None:
             return
-        roles = self.get_all_roles()
-        return list(filter(lambda role: role.name in role_names, roles))
+        roles_by_name = {role.name: role for role in self.get_all_roles()}
+        return [
+            roles_by_name[role_name]
+            for role_name in dict.fromkeys(role_names)  # Drops duplicates, keeps order
+            if role_name in roles_by_name
+        ]
 
     @result_or_error(response_model=KeycloakRole, is_list=True)
     def get_user_roles(self, user_id: str) -> List[KeycloakRole]:
@@ -553,8 +1026,8 @@ class FastAPIKeycloak:
         """
         if group_names is None:
             return
-        groups = self.get_all_groups()
-        return list(filter(lambda group: group.name in group_names, groups))
+        wanted = set(group_names)
+        return [group for group in self.get_all_groups() if group.name in wanted]
 
     def get_subgroups(self, group: KeycloakGroup, path: str):
         """Utility function to iterate through nested group structures
@@ -566,13 +1039,16 @@ class FastAPIKeycloak:
         Returns:
             KeycloakGroup: Keycloak group representation or none if not exists
         """
-        for subgroup in group.subGroups:
+        pending = deque(group.subGroups or ())
+        visited = set()
+        while pending:  # Breadth-first, no recursion depth limit for deep trees
+            subgroup = pending.popleft()
+            if subgroup.id in visited:
+                continue
+            visited.add(subgroup.id)
             if subgroup.path == path:
                 return subgroup
-            elif subgroup.subGroups:
-                for subgroup in group.subGroups:
-                    if subgroups := self.get_subgroups(subgroup, path):
-                        return subgroups
+            pending.extend(subgroup.subGroups or ())
         # Went through the tree without hits
         return None
 
@@ -589,21 +1065,22 @@ class FastAPIKeycloak:
         Returns:
             KeycloakGroup: Full entries stored at Keycloak. Or None if the path not found
 
+        Notes:
+            - Resolved by Keycloak itself, no need to fetch and walk the whole group tree
+
         Raises:
             KeycloakError: If the resulting response is not a successful HTTP-Code (>299)
         """
-        groups = self.get_all_groups()
-
-        for group in groups:
-            if group.path == path:
-                return group
-            elif search_in_subgroups and group.subGroups:
-                for group in group.subGroups:
-                    if group.path == path:
-                        return group
-                    res = self.get_subgroups(group, path)
-                    if res is not None:
-                        return res
+        path = path.strip("/")
+        if not search_in_subgroups and "/" in path:  # Only base groups are of interest
+            return None
+        response = self._admin_request(
+            url=f"{self._admin_uri}/group-by-path/{quote(path)}",
+            method=HTTPMethod.GET,
+        )
+        if response.status_code == status.HTTP_404_NOT_FOUND:
+            return None
+        return response
 
     @result_or_error(response_model=KeycloakGroup)
     def get_group(self, group_id: str) -> KeycloakGroup or None:
@@ -767,7 +1244,8 @@ class FastAPIKeycloak:
         initial_roles: List[str] = None,
         send_email_verification: bool = True,
         attributes: dict[str, Any] = None,
-    ) -> KeycloakUser:
+        return_full: bool = True,
+    ) -> KeycloakUser | str:
         """
 
         Args:
@@ -782,12 +1260,15 @@ class FastAPIKeycloak:
                                             action and the email triggered - if the user was created successfully.
                                             Defaults to `True`
             attributes (dict): attributes of new user
+            return_full (bool): If False, the ID of the new user is returned instead of fetching the full
+                                representation once more. Defaults to `True`
 
         Returns:
-            KeycloakUser: If the creation succeeded
+            KeycloakUser: If the creation succeeded. Or the user ID (str) if `return_full` is False
 
         Notes:
             - Also triggers the email verification email
+            - The email verification and the initial roles are requested concurrently
 
         Raises:
             KeycloakError: If the resulting response is not a successful HTTP-Code (>299)
@@ -812,13 +1293,23 @@ class FastAPIKeycloak:
         )
         if response.status_code != 201:
             return response
-        user = self.get_user(query=f"username={username}")
+        # Keycloak answers with the location of the new user, no need to look it up
+        user_id = response.headers["Location"].rsplit("/", 1)[-1]
+        # Only offload the roles if both follow-ups are needed, a single one is sent from this thread
+        roles_added = (
+            self._executor.submit(self.add_user_roles, initial_roles, user_id)
+            if initial_roles and send_email_verification
+            else None
+        )
         if send_email_verification:
-            self.send_email_verification(user.id)
-        if initial_roles:
-            self.add_user_roles(initial_roles, user.id)
-            user = self.get_user(user_id=user.id)
-        return user
+            self.send_email_verification(user_id)
+        elif initial_roles:
+            self.add_user_roles(initial_roles, user_id)
+        if roles_added is not None:
+            roles_added.result()  # Raises the KeycloakError of a failed follow-up
+        if not return_full:
+            return user_id
+        return self.get_user(user_id=user_id)
 
     @result_or_error()
     def change_password(
@@ -845,11 +1336,14 @@ class FastAPIKeycloak:
             "type": "password",
             "value": new_password,
         }
-        return self._admin_request(
+        response = self._admin_request(
             url=f"{self.users_uri}/{user_id}/reset-password",
             data=credentials,
             method=HTTPMethod.PUT,
         )
+        # A temporary password adds the UPDATE_PASSWORD required action
+        self._evict_user(user_id)
+        return response
 
     @result_or_error()
     def send_email_verification(self, user_id: str) -> dict:
@@ -882,84 +1376,233 @@ class FastAPIKeycloak:
 
         Raises:
             KeycloakError: If the resulting response is not a successful HTTP-Code (>299)
+
+        Notes:
+            - If enabled (see `user_cache` and `user_cache_ttl` of the constructor), users looked up by ID are
+              cached. Updates and deletions through this instance evict them, changes made elsewhere may be seen
+              with a delay of up to the cache TTL
         """
         if user_id is None:
             self.validate_query(query)
             response = self._admin_request(
                 url=f"{self.users_uri}?{query}", method=HTTPMethod.GET
             )
-            if not response.json():
-                raise UserNotFound(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    reason=f"User query with filters of [{query}] did no match any users",
-                )
-            return KeycloakUser(**response.json()[0])
-        else:
-            response = self._admin_request(
-                url=f"{self.users_uri}/{user_id}", method=HTTPMethod.GET
-            )
-            if response.status_code == status.HTTP_404_NOT_FOUND:
-                raise UserNotFound(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    reason=f"User with user_id[{user_id}] was not found",
-                )
-            return KeycloakUser(**response.json())
+            return self._user_from_response(response, query=query)
+        user = self._cached_user(user_id)
+        if user is None:
+            user = self._cache_user(self._fetch_user(user_id))
+        return user
 
-    @result_or_error(response_model=KeycloakUser)
-    def update_user(self, user: KeycloakUser):
-        """Updates a user. Requires the whole object.
+    def _fetch_user(self, user_id: str) -> KeycloakUser:
+        """Fetches a user by ID from Keycloak, bypassing the user cache. Read-modify-write paths must use it, so
+        they never write a stale representation back
 
         Args:
-            user (KeycloakUser): The (new) user object
+            user_id (str): The user ID of interest
 
         Returns:
-            KeycloakUser: The updated user
+            KeycloakUser: If the user was found
 
         Raises:
-            KeycloakError: If the resulting response is not a successful HTTP-Code (>299)
-
-        Notes: - You may alter any aspect of the user object, also the requiredActions for instance. There is no
-        explicit function for updating those as it is a user update in essence
+            UserNotFound: If no user matches the user ID
         """
         response = self._admin_request(
-            url=f"{self.users_uri}/{user.id}", data=user.__dict__, method=HTTPMethod.PUT
+            url=f"{self.users_uri}/{user_id}", method=HTTPMethod.GET
         )
-        if response.status_code == 204:  # Update successful
-            return self.get_user(user_id=user.id)
-        return response
+        return self._user_from_response(response, user_id=user_id)
 
-    @result_or_error()
-    def delete_user(self, user_id: str) -> dict:
-        """Deletes an user
+    @result_or_error(response_model=KeycloakUser)
+    async def get_user_async(
+        self, user_id: str = None, query: str = ""
+    ) -> KeycloakUser:
+        """Asynchronous counterpart of `get_user`
 
         Args:
             user_id (str): The user ID of interest
+            query: Query string. e.g. `email=testuser@codespecialist.com` or `username=codespecialist`
 
         Returns:
-            dict: Proxied response payload
+            KeycloakUser: If the user was found
 
         Raises:
             KeycloakError: If the resulting response is not a successful HTTP-Code (>299)
         """
-        return self._admin_request(
-            url=f"{self.users_uri}/{user_id}", method=HTTPMethod.DELETE
-        )
+        if user_id is None:
+            self.validate_query(query)
+            response = await self._admin_request_async(
+                url=f"{self.users_uri}?{query}", method=HTTPMethod.GET
+            )
+            return self._user_from_response(response, query=query)
+        user = self._cached_user(user_id)
+        if user is None:
+            response = await self._admin_request_async(
+                url=f"{self.users_uri}/{user_id}", method=HTTPMethod.GET
+            )
+            user = self._cache_user(self._user_from_response(response, user_id=user_id))
+        return user
 
-    @result_or_error(response_model=KeycloakUser, is_list=True)
-    def get_all_users(self) -> List[KeycloakUser]:
-        """Returns all users of the realm
+    def _cached_user(self, user_id: str) -> KeycloakUser | None:
+        """Returns a copy of a cached user, so callers can modify it freely
 
-        Returns:
-            List[KeycloakUser]: All Keycloak users of the realm
+        Args:
+            user_id (str): The user ID of interest
 
-        Raises:
-            KeycloakError: If the resulting response is not a successful HTTP-Code (>299)
+        Returns:
+            KeycloakUser | None: The cached user, None if it is not cached (anymore)
         """
-        return self._admin_request(url=self.users_uri, method=HTTPMethod.GET)
+        if self._user_cache is None:  # Caching disabled
+            return None
+        with self._user_cache_lock:
+            user = self._user_cache.get(user_id)
+        return None if user is None else user.copy(deep=True)
 
-    @result_or_error(response_model=KeycloakIdentityProvider, is_list=True)
-    def get_identity_providers(self) -> List[KeycloakIdentityProvider]:
-        """Returns all configured identity Providers
+    def _cache_user(self, user: KeycloakUser) -> KeycloakUser:
+        """Caches a copy of a user that was just fetched from Keycloak
+
+        Args:
+            user (KeycloakUser): The user to be cached
+
+        Returns:
+            KeycloakUser: The given user
+        """
+        if self._user_cache is None:  # Caching disabled
+            return user
+        with self._user_cache_lock:
+            self._user_cache[user.id] = user.copy(deep=True)
+        return user
+
+    def _evict_user(self, user_id: str) -> None:
+        """Drops a user from the cache after it was changed or deleted
+
+        Args:
+            user_id (str): The user ID of interest
+
+        Returns:
+            None: Inplace method that updates the user cache
+        """
+        if self._user_cache is None:  # Caching disabled
+            return
+        with self._user_cache_lock:
+            self._user_cache.pop(user_id, None)
+
+    @staticmethod
+    def _user_from_response(
+        response: Response | httpx.Response, user_id: str = None, query: str = ""
+    ) -> KeycloakUser:
+        """Builds the user of a `get_user` response, either looked up by ID or by query
+
+        Args:
+            response (Response | httpx.Response): Response of Keycloak
+            user_id (str): The user ID of interest
+            query: Query string used if no user ID was given
+
+        Returns:
+            KeycloakUser: If the user was found
+
+        Raises:
+            UserNotFound: If no user matches the user ID or the query
+        """
+        if user_id is None:
+            users = orjson.loads(response.content)
+            if not users:
+                raise UserNotFound(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    reason=f"User query with filters of [{query}] did no match any users",
+                )
+            return KeycloakUser(**users[0])
+        if response.status_code == status.HTTP_404_NOT_FOUND:
+            raise UserNotFound(
+                status_code=status.HTTP_404_NOT_FOUND,
+                reason=f"User with user_id[{user_id}] was not found",
+            )
+        return KeycloakUser(**orjson.loads(response.content))
+
+    @result_or_error(response_model=KeycloakUser)
+    def update_user(self, user: KeycloakUser, refresh: bool = False):
+        """Updates a user. Requires the whole object.
+
+        Args:
+            user (KeycloakUser): The (new) user object
+            refresh (bool): If True, the user is fetched from Keycloak again after the update, e.g. to obtain
+            fields Keycloak derives on its own. Otherwise the given user object is returned
+
+        Returns:
+            KeycloakUser: The updated user
+
+        Raises:
+            KeycloakError: If the resulting response is not a successful HTTP-Code (>299)
+
+        Notes: - You may alter any aspect of the user object, also the requiredActions for instance. There is no
+        explicit function for updating those as it is a user update in essence
+        """
+        response = self._admin_request(
+            url=f"{self.users_uri}/{user.id}",
+            data=user.dict(exclude_none=True),
+            method=HTTPMethod.PUT,
+        )
+        self._evict_user(user.id)
+        if response.status_code == 204:  # Update successful
+            return self.get_user(user_id=user.id) if refresh else user
+        return response
+
+    @result_or_error(response_model=KeycloakUser)
+    async def update_user_async(self, user: KeycloakUser, refresh: bool = False):
+        """Asynchronous counterpart of `update_user`
+
+        Args:
+            user (KeycloakUser): The (new) user object
+            refresh (bool): If True, the user is fetched from Keycloak again after the update
+
+        Returns:
+            KeycloakUser: The updated user
+
+        Raises:
+            KeycloakError: If the resulting response is not a successful HTTP-Code (>299)
+        """
+        response = await self._admin_request_async(
+            url=f"{self.users_uri}/{user.id}",
+            data=user.dict(exclude_none=True),
+            method=HTTPMethod.PUT,
+        )
+        self._evict_user(user.id)
+        if response.status_code == 204:  # Update successful
+            return await self.get_user_async(user_id=user.id) if refresh else user
+        return response
+
+    @result_or_error()
+    def delete_user(self, user_id: str) -> dict:
+        """Deletes an user
+
+        Args:
+            user_id (str): The user ID of interest
+
+        Returns:
+            dict: Proxied response payload
+
+        Raises:
+            KeycloakError: If the resulting response is not a successful HTTP-Code (>299)
+        """
+        response = self._admin_request(
+            url=f"{self.users_uri}/{user_id}", method=HTTPMethod.DELETE
+        )
+        self._evict_user(user_id)
+        return response
+
+    @result_or_error(response_model=KeycloakUser, is_list=True)
+    def get_all_users(self) -> List[KeycloakUser]:
+        """Returns all users of the realm
+
+        Returns:
+            List[KeycloakUser]: All Keycloak users of the realm
+
+        Raises:
+            KeycloakError: If the resulting response is not a successful HTTP-Code (>299)
+        """
+        return self._admin_request(url=self.users_uri, method=HTTPMethod.GET)
+
+    @result_or_error(response_model=KeycloakIdentityProvider, is_list=True)
+    def get_identity_providers(self) -> List[KeycloakIdentityProvider]:
+        """Returns all configured identity Providers
 
         Returns:
             List[KeycloakIdentityProvider]: All configured identity providers
@@ -967,7 +1610,8 @@ class FastAPIKeycloak:
         Raises:
             KeycloakError: If the resulting response is not a successful HTTP-Code (>299)
         """
-        return self._admin_request(url=self.providers_uri, method=HTTPMethod.GET).json()
+        response = self._admin_request(url=self.providers_uri, method=HTTPMethod.GET)
+        return orjson.loads(response.content)
 
     # @result_or_error(response_model=KeycloakToken)
     # def user_login(self, username: str, password: str) -> KeycloakToken:
@@ -1051,14 +1695,108 @@ class FastAPIKeycloak:
         # Fetch the user by username
         user = self.get_user(query=f"username={username}")
 
+        # Usually served from the cached realm settings. Without a limit the sessions don't need to be fetched
+        max_sessions = self.get_max_concurrent_sessions()
+
+        # With a session limit the sessions are fetched concurrently, the lockout state is requested from here
+        active_sessions = (
+            self._executor.submit(self.get_active_sessions, user.id)
+            if max_sessions > 0
+            else None
+        )
+
         # Check if the user is temporarily disabled
-        if self.is_user_temporarily_disabled(user_id=user.id):
-            raise HTTPException(
-                status_code=403,
-                detail="The user is temporarily disabled due to too many failed login attempts.",
-            )
+        if self.is_user_temporarily_disabled(user.id):
+            raise self._temporarily_disabled_exception()
 
         # Validate account expiration
+        self._check_account_expiration(user)
+
+        # Validate the number of active sessions for the user
+        if active_sessions is not None:
+            self._check_session_limit(len(active_sessions.result()), max_sessions)
+
+        # Attempt to log in
+        response = self._session.post(
+            url=self.token_uri,
+            headers=FORM_HEADERS,
+            data=self._password_grant(username, password),
+            timeout=self.timeout,
+        )
+        return self._login_result(response, user)
+
+    async def user_login_async(self, username: str, password: str) -> dict:
+        """Asynchronous counterpart of `user_login`
+
+        Args:
+            username (str): The username or email of the user.
+            password (str): The user's password.
+
+        Returns:
+            dict: Access tokens, refresh tokens, and other relevant data.
+
+        Raises:
+            HTTPException: If login fails due to invalid credentials, expired account,
+            or exceeded session limits.
+        """
+        user = await self.get_user_async(query=f"username={username}")
+
+        max_sessions = await self.get_max_concurrent_sessions_async()
+        if max_sessions > 0:
+            temporarily_disabled, active_sessions = await asyncio.gather(
+                self.is_user_temporarily_disabled_async(user_id=user.id),
+                self.get_active_sessions_async(user_id=user.id),
+            )
+        else:  # No session limit, the sessions are not needed
+            temporarily_disabled = await self.is_user_temporarily_disabled_async(
+                user_id=user.id
+            )
+            active_sessions = None
+        if temporarily_disabled:
+            raise self._temporarily_disabled_exception()
+
+        self._check_account_expiration(user)
+
+        if active_sessions is not None:
+            self._check_session_limit(len(active_sessions), max_sessions)
+
+        response = await self._aclient.post(
+            url=self.token_uri,
+            headers=FORM_HEADERS,
+            content=self._password_grant(username, password),
+        )
+        return self._login_result(response, user)
+
+    def _password_grant(self, username: str, password: str) -> str:
+        """Form encoded body to exchange username and password for tokens
+
+        Args:
+            username (str): The username or email of the user.
+            password (str): The user's password.
+
+        Returns:
+            str: Body of the `password` grant
+        """
+        return f"{self._password_grant_form}&username={quote_plus(username)}&password={quote_plus(password)}"
+
+    @staticmethod
+    def _temporarily_disabled_exception() -> HTTPException:
+        """Error returned to users locked out by the brute force detection"""
+        return HTTPException(
+            status_code=403,
+            detail="The user is temporarily disabled due to too many failed login attempts.",
+        )
+
+    @staticmethod
+    def _check_account_expiration(user: KeycloakUser) -> None:
+        """Validates the `account_expiration` attribute of a user, if any
+
+        Args:
+            user (KeycloakUser): The user logging in
+
+        Raises:
+            HTTPException: If the account expired or the expiration date can't be parsed
+        """
         expiration_date = None
         if user.attributes and isinstance(user.attributes, dict):
             expiration_date = user.attributes.get("account_expiration")
@@ -1070,41 +1808,51 @@ class FastAPIKeycloak:
                 else expiration_date
             )
             try:
-                expiration_date = datetime.fromisoformat(expiration_date.rstrip("Z"))
-                if expiration_date < datetime.utcnow():
-                    raise HTTPException(
-                        status_code=403,
-                        detail="The account has expired. Please contact the administrator.",
-                    )
+                expires_at = _parse_expiration(expiration_date)
             except ValueError:
                 raise HTTPException(
                     status_code=400,
                     detail="Invalid account expiration date format.",
                 )
+            if expires_at < time.time():
+                raise HTTPException(
+                    status_code=403,
+                    detail="The account has expired. Please contact the administrator.",
+                )
 
-        # Validate the number of active sessions for the user
-        active_sessions = self.get_active_sessions(user_id=user.id)
-        max_sessions = self.get_max_concurrent_sessions()
-        if max_sessions > 0 and len(active_sessions) >= max_sessions:
+    @staticmethod
+    def _check_session_limit(active_sessions: int, max_sessions: int) -> None:
+        """Validates the number of active sessions of a user against the limit of the realm
+
+        Args:
+            active_sessions (int): Number of active sessions of the user
+            max_sessions (int): Maximum number of concurrent sessions, 0 if unlimited
+
+        Raises:
+            HTTPException: If the limit is reached
+        """
+        if max_sessions > 0 and active_sessions >= max_sessions:
             raise HTTPException(
                 status_code=403,
                 detail="Concurrent session limit reached. Please close a session and try again.",
             )
 
-        # Attempt to log in
-        headers = {"Content-Type": "application/x-www-form-urlencoded"}
-        data = {
-            "client_id": self.client_id,
-            "client_secret": self.client_secret,
-            "username": username,
-            "password": password,
-            "grant_type": "password",
-            "scope": self.scope,
-        }
-        response = requests.post(
-            url=self.token_uri, headers=headers, data=data, timeout=self.timeout
-        )
+    @staticmethod
+    def _login_result(response: Response | httpx.Response, user: KeycloakUser) -> dict:
+        """Validates the response of the token endpoint to a login
+
+        Args:
+            response (Response | httpx.Response): Response of the token endpoint
+            user (KeycloakUser): The user logging in
+
+        Returns:
+            dict: Access tokens, refresh tokens, and other relevant data.
 
+        Raises:
+            HTTPException: If the credentials are invalid
+            MandatoryActionException: If the login is not possible due to mandatory actions
+            KeycloakError: If the token response can't be parsed
+        """
         # Validate the authentication result
         if response.status_code == 401:
             raise HTTPException(status_code=401, detail="Invalid credentials.")
@@ -1112,23 +1860,16 @@ class FastAPIKeycloak:
         if response.status_code == 400:
             if len(user.requiredActions) > 0:
                 reason = user.requiredActions[0]
-                exception = {
-                    "update_user_locale": UpdateUserLocaleException(),
-                    "CONFIGURE_TOTP": ConfigureTOTPException(),
-                    "VERIFY_EMAIL": VerifyEmailException(),
-                    "UPDATE_PASSWORD": UpdatePasswordException(),
-                    "UPDATE_PROFILE": UpdateProfileException(),
-                }.get(
-                    reason,
-                    MandatoryActionException(
-                        detail=f"This user cannot log in until the required action is resolved: {reason}."
-                    ),
+                exception = _REQUIRED_ACTION_EXCEPTIONS.get(reason)
+                if exception is not None:
+                    raise exception()
+                raise MandatoryActionException(
+                    detail=f"This user cannot log in until the required action is resolved: {reason}."
                 )
-                raise exception
 
         # Return tokens if login is successful
         try:
-            token_data = response.json()
+            token_data = orjson.loads(response.content)
             return {
                 "access_token": token_data.get("access_token"),
                 "refresh_token": token_data.get("refresh_token"),
@@ -1156,11 +1897,90 @@ class FastAPIKeycloak:
             response = self._admin_request(
                 url=f"{self.users_uri}/{user_id}/sessions", method=HTTPMethod.GET
             )
-            return response.json()
-        except Exception as e:
+            return orjson.loads(response.content)
+        except (requests.RequestException, ValueError) as e:
             raise KeycloakError(
                 status_code=400, reason=f"Error retrieving active sessions: {str(e)}"
+            ) from e
+
+    async def get_active_sessions_async(self, user_id: str) -> list:
+        """Versión asíncrona de `get_active_sessions`.
+
+        Args:
+            user_id (str): ID del usuario.
+
+        Returns:
+            list: Lista de sesiones activas.
+        """
+        try:
+            response = await self._admin_request_async(
+                url=f"{self.users_uri}/{user_id}/sessions", method=HTTPMethod.GET
             )
+            return orjson.loads(response.content)
+        except (httpx.HTTPError, ValueError) as e:
+            raise KeycloakError(
+                status_code=400, reason=f"Error retrieving active sessions: {str(e)}"
+            ) from e
+
+    def _cached_realm_settings(self, ttl: float) -> dict | None:
+        """Devuelve la configuración del realm en caché si tiene menos de `ttl` segundos.
+
+        Args:
+            ttl (float): Antigüedad máxima en segundos de la configuración en caché.
+
+        Returns:
+            dict | None: Configuración del realm, o None si no hay caché vigente.
+        """
+        cached = self._realm_settings_cache
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+        return None
+
+    def _get_realm_settings(self, ttl: float = REALM_SETTINGS_CACHE_TTL) -> dict:
+        """Obtiene la configuración del realm, reutilizándola durante `ttl` segundos.
+
+        Args:
+            ttl (float): Antigüedad máxima en segundos de la configuración en caché.
+
+        Returns:
+            dict: Representación del realm.
+
+        Raises:
+            KeycloakError: Si Keycloak no devuelve la configuración; los errores nunca se guardan en caché.
+        """
+        realm_settings = self._cached_realm_settings(ttl)
+        if realm_settings is None:
+            response = self._admin_request(url=self._admin_uri, method=HTTPMethod.GET)
+            if response.status_code != 200:
+                raise _keycloak_error(response)
+            realm_settings = orjson.loads(response.content)
+            self._realm_settings_cache = (time.monotonic(), realm_settings)
+        return realm_settings
+
+    async def _get_realm_settings_async(
+        self, ttl: float = REALM_SETTINGS_CACHE_TTL
+    ) -> dict:
+        """Versión asíncrona de `_get_realm_settings`.
+
+        Args:
+            ttl (float): Antigüedad máxima en segundos de la configuración en caché.
+
+        Returns:
+            dict: Representación del realm.
+
+        Raises:
+            KeycloakError: Si Keycloak no devuelve la configuración; los errores nunca se guardan en caché.
+        """
+        realm_settings = self._cached_realm_settings(ttl)
+        if realm_settings is None:
+            response = await self._admin_request_async(
+                url=self._admin_uri, method=HTTPMethod.GET
+            )
+            if response.status_code != 200:
+                raise _keycloak_error(response)
+            realm_settings = orjson.loads(response.content)
+            self._realm_settings_cache = (time.monotonic(), realm_settings)
+        return realm_settings
 
     def get_max_concurrent_sessions(self) -> int:
         """Obtiene el número máximo de sesiones concurrentes permitidas a nivel global en el realm.
@@ -1169,18 +1989,31 @@ class FastAPIKeycloak:
             int: Número máximo de sesiones concurrentes permitidas.
         """
         try:
-            # Aquí haces la solicitud para obtener la configuración del realm
-            realm_settings = self._admin_request(
-                url=f"{self._admin_uri}", method=HTTPMethod.GET
-            ).json()
+            # La configuración del realm casi nunca cambia, se toma de la caché
+            realm_settings = self._get_realm_settings()
 
             # Retorna el valor de 'max-sessions' de los atributos del realm
             return int(realm_settings.get("attributes", {}).get("max-sessions", 0))
-        except Exception as e:
+        except (requests.RequestException, ValueError) as e:
             raise KeycloakError(
                 status_code=400,
                 reason=f"Error retrieving max concurrent sessions setting: {str(e)}",
-            )
+            ) from e
+
+    async def get_max_concurrent_sessions_async(self) -> int:
+        """Versión asíncrona de `get_max_concurrent_sessions`.
+
+        Returns:
+            int: Número máximo de sesiones concurrentes permitidas.
+        """
+        try:
+            realm_settings = await self._get_realm_settings_async()
+            return int(realm_settings.get("attributes", {}).get("max-sessions", 0))
+        except (httpx.HTTPError, ValueError) as e:
+            raise KeycloakError(
+                status_code=400,
+                reason=f"Error retrieving max concurrent sessions setting: {str(e)}",
+            ) from e
 
     def set_realm_session_lifespan(self, session_lifespan: int):
         """Establece el tiempo máximo de duración de la sesión para todos los usuarios del realm.
@@ -1205,6 +2038,8 @@ class FastAPIKeycloak:
             response = self._admin_request(
                 url=realm_uri, method=HTTPMethod.PUT, data=data
             )
+            # La configuración en caché ya no es válida
+            self._realm_settings_cache = None
 
             if response.status_code == 204:  # No Content, meaning successful update
                 return {"message": "Realm session lifespan updated successfully."}
@@ -1214,11 +2049,11 @@ class FastAPIKeycloak:
                     reason=f"Failed to update realm session lifespan: {response.content.decode('utf-8')}",
                 )
 
-        except Exception as e:
+        except (requests.RequestException, ValueError) as e:
             raise KeycloakError(
                 status_code=400,
                 reason=f"Error updating realm session lifespan: {str(e)}",
-            )
+            ) from e
 
     def set_session_max_lifespan(
         self, session_max_lifespan: int, idle_timeout: int = None
@@ -1250,6 +2085,8 @@ class FastAPIKeycloak:
             response = self._admin_request(
                 url=realm_uri, method=HTTPMethod.PUT, data=data
             )
+            # La configuración en caché ya no es válida
+            self._realm_settings_cache = None
 
             if response.status_code == 204:  # No Content, meaning successful update
                 return {"message": "Session max lifespan updated successfully."}
@@ -1259,10 +2096,10 @@ class FastAPIKeycloak:
                     reason=f"Failed to update session max lifespan: {response.content.decode('utf-8')}",
                 )
 
-        except Exception as e:
+        except (requests.RequestException, ValueError) as e:
             raise KeycloakError(
                 status_code=400, reason=f"Error updating session max lifespan: {str(e)}"
-            )
+            ) from e
 
     def set_max_concurrent_sessions(self, max_sessions: int):
         """Establece el número máximo de sesiones concurrentes para los usuarios del realm.
@@ -1287,6 +2124,8 @@ class FastAPIKeycloak:
             response = self._admin_request(
                 url=realm_uri, method=HTTPMethod.PUT, data=data
             )
+            # La configuración en caché ya no es válida
+            self._realm_settings_cache = None
 
             if response.status_code == 204:  # No Content, meaning successful update
                 return {"message": "Max concurrent sessions updated successfully."}
@@ -1296,11 +2135,11 @@ class FastAPIKeycloak:
                     reason=f"Failed to update max concurrent sessions: {response.content.decode('utf-8')}",
                 )
 
-        except Exception as e:
+        except (requests.RequestException, ValueError) as e:
             raise KeycloakError(
                 status_code=400,
                 reason=f"Error updating max concurrent sessions: {str(e)}",
-            )
+            ) from e
 
     def logout_user(self, user_id: str) -> dict:
         """Cierra la sesión de un usuario en Keycloak.
@@ -1329,10 +2168,10 @@ class FastAPIKeycloak:
                     reason=f"Failed to terminate user session: {response.content.decode('utf-8')}",
                 )
 
-        except Exception as e:
+        except (requests.RequestException, ValueError) as e:
             raise KeycloakError(
                 status_code=400, reason=f"Error terminating user session: {str(e)}"
-            )
+            ) from e
 
     def refresh_token(self, refresh_token: str) -> dict:
         """Realiza el intercambio de refresh token por un nuevo access token.
@@ -1346,29 +2185,53 @@ class FastAPIKeycloak:
         Raises:
             HTTPException: Si hay algún problema con el refresh token.
         """
-        # content_type = "application/json"
-        content_type = "application/x-www-form-urlencoded"
-        headers = {"Content-Type": f"{content_type}"}
-        data = {
-            "client_id": self.client_id,
-            "client_secret": self.client_secret,
-            "grant_type": "refresh_token",
-            "refresh_token": refresh_token,
-        }
+        data = f"{self._refresh_grant_form}&refresh_token={quote_plus(refresh_token)}"
 
         # Realiza la solicitud al endpoint de token de Keycloak
-        response = requests.post(
-            url=self.token_uri, headers=headers, data=data, timeout=self.timeout
+        response = self._session.post(
+            url=self.token_uri, headers=FORM_HEADERS, data=data, timeout=self.timeout
         )
+        return self._refresh_result(response)
+
+    async def refresh_token_async(self, refresh_token: str) -> dict:
+        """Versión asíncrona de `refresh_token`.
+
+        Args:
+            refresh_token (str): El token de refresh que se intercambiará.
+
+        Returns:
+            dict: Diccionario que contiene el nuevo access token, refresh token y otros detalles.
 
+        Raises:
+            HTTPException: Si hay algún problema con el refresh token.
+        """
+        data = f"{self._refresh_grant_form}&refresh_token={quote_plus(refresh_token)}"
+        response = await self._aclient.post(
+            url=self.token_uri, headers=FORM_HEADERS, content=data
+        )
+        return self._refresh_result(response)
+
+    @staticmethod
+    def _refresh_result(response: Response | httpx.Response) -> dict:
+        """Valida la respuesta del endpoint de token a un refresh.
+
+        Args:
+            response (Response | httpx.Response): Respuesta del endpoint de token.
+
+        Returns:
+            dict: Diccionario que contiene el nuevo access token, refresh token y otros detalles.
+
+        Raises:
+            HTTPException: Si hay algún problema con el refresh token.
+        """
         # Si la respuesta es correcta, devolvemos el nuevo token
         if response.status_code == 200:
-            return response.json()
+            return orjson.loads(response.content)
 
         # Si hay algún error, lanzamos una excepción
         raise HTTPException(
             status_code=response.status_code,
-            detail=f"Error refreshing token: {response.json().get('error_description', 'Unknown error')}",
+            detail=f"Error refreshing token: {orjson.loads(response.content).get('error_description', 'Unknown error')}",
         )
 
     @result_or_error(response_model=KeycloakToken)
@@ -1389,17 +2252,9 @@ class FastAPIKeycloak:
         Raises:
             KeycloakError: If the resulting response is not a successful HTTP-Code (>299)
         """
-        headers = {"Content-Type": "application/x-www-form-urlencoded"}
-        data = {
-            "client_id": self.client_id,
-            "client_secret": self.client_secret,
-            "code": code,
-            "session_state": session_state,
-            "grant_type": "authorization_code",
-            "redirect_uri": self.callback_uri,
-        }
-        return requests.post(
-            url=self.token_uri, headers=headers, data=data, timeout=self.timeout
+        data = f"{self._authorization_code_form}&code={quote_plus(code)}&session_state={quote_plus(session_state)}"
+        return self._session.post(
+            url=self.token_uri, headers=FORM_HEADERS, data=data, timeout=self.timeout
         )
 
     def _admin_request(
@@ -1421,78 +2276,44 @@ class FastAPIKeycloak:
         Returns:
             Response: Response of Keycloak
         """
-        headers = {
-            "Content-Type": content_type,
-            "Authorization": f"Bearer {self.admin_token}",
-        }
-        return requests.request(
+        headers = self._admin_headers()
+        if data is not None:
+            headers = {**headers, "Content-Type": content_type}
+        return self._session.request(
             method=method.name,
             url=url,
-            data=json.dumps(data),
+            data=_encode_body(data, content_type),
             headers=headers,
             timeout=self.timeout,
         )
 
-    @functools.cached_property
-    def login_uri(self):
-        """The URL for users to login on the realm. Also adds the client id, the callback and the scope."""
-        params = {
-            "scope": self.scope,
-            "response_type": "code",
-            "client_id": self.client_id,
-            "redirect_uri": self.callback_uri,
-        }
-        return f"{self.authorization_uri}?{urlencode(params)}"
-
-    @functools.cached_property
-    def authorization_uri(self):
-        """The authorization endpoint URL"""
-        return self.open_id_configuration.get("authorization_endpoint")
-
-    @functools.cached_property
-    def token_uri(self):
-        """The token endpoint URL"""
-        return self.open_id_configuration.get("token_endpoint")
-
-    @functools.cached_property
-    def logout_uri(self):
-        """The logout endpoint URL"""
-        return self.open_id_configuration.get("end_session_endpoint")
-
-    @functools.cached_property
-    def realm_uri(self):
-        """The realm's endpoint URL"""
-        return f"{self.server_url}/realms/{self.realm}"
-
-    @functools.cached_property
-    def users_uri(self):
-        """The users endpoint URL"""
-        return self.admin_uri(resource="users")
-
-    @functools.cached_property
-    def roles_uri(self):
-        """The roles endpoint URL"""
-        return self.admin_uri(resource="roles")
-
-    @functools.cached_property
-    def groups_uri(self):
-        """The groups endpoint URL"""
-        return self.admin_uri(resource="groups")
-
-    @functools.cached_property
-    def _admin_uri(self):
-        """The base endpoint for any admin related action"""
-        return f"{self.server_url}/admin/realms/{self.realm}"
+    async def _admin_request_async(
+        self,
+        url: str,
+        method: HTTPMethod,
+        data: dict = None,
+        content_type: str = "application/json",
+    ) -> httpx.Response:
+        """Asynchronous counterpart of `_admin_request`, sent with the shared `httpx.AsyncClient`
 
-    @functools.cached_property
-    def _open_id(self):
-        """The base endpoint for any opendid connect config info"""
-        return f"{self.realm_uri}/protocol/openid-connect"
+        Args:
+            url (str): The URL to be called
+            method (HTTPMethod): The HTTP verb to be used
+            data (dict): The payload of the request
+            content_type (str): The content type of the request
 
-    @functools.cached_property
-    def providers_uri(self):
-        """The endpoint that returns all configured identity providers"""
-        return self.admin_uri(resource="identity-provider/instances")
+        Returns:
+            httpx.Response: Response of Keycloak
+        """
+        headers = await self._admin_headers_async()
+        if data is not None:
+            headers = {**headers, "Content-Type": content_type}
+        return await self._aclient.request(
+            method=method.name,
+            url=url,
+            content=_encode_body(data, content_type),
+            headers=headers,
+        )
 
     def admin_uri(self, resource: str):
         """Returns a admin resource URL"""
@@ -1535,16 +2356,42 @@ class FastAPIKeycloak:
             ExpiredSignatureError: If the token is expired (exp > datetime.now())
             JWTError: If decoding fails or the signature is invalid
             JWTClaimsError: If any claim is invalid
+
+        Notes:
+            - With the default options, verified payloads are cached (keyed by the SHA-256 digest of the token and
+              the audience) for at most `JWT_CACHE_TTL` seconds and never beyond the expiry of the token
+            - Cached payloads are stored as immutable JSON bytes, callers always receive a payload of their own
         """
-        if options is None:
-            options = {
+        # Custom verification, neither served from nor stored in the cache
+        if options is not None:
+            return jwt.decode(
+                token=token,
+                key=self._signing_key(token),
+                options=options,
+                audience=audience,
+            )
+        # Only the digest of the token is kept, never the token itself
+        key = (hashlib.sha256(token.encode()).digest(), audience)
+        with self._jwt_cache_lock:
+            cached = self._jwt_cache.get(key)
+        if cached is not None and cached[1] > time.time():
+            # Stored serialized, every hit gets its own payload to mutate, nested claims included
+            return orjson.loads(cached[0])
+        decoded_token = jwt.decode(
+            token=token,
+            key=self._signing_key(token),
+            options={
                 "verify_signature": True,
                 "verify_aud": audience is not None,
                 "verify_exp": True,
-            }
-        return jwt.decode(
-            token=token, key=self.public_key, options=options, audience=audience
+            },
+            audience=audience,
         )
+        # Never reuse a payload beyond the expiry of the token itself
+        expires_at = min(decoded_token.get("exp", 0), time.time() + JWT_CACHE_TTL)
+        with self._jwt_cache_lock:
+            self._jwt_cache[key] = (orjson.dumps(decoded_token), expires_at)
+        return decoded_token
 
     def __str__(self):
         """String representation"""
@@ -1567,7 +2414,8 @@ class FastAPIKeycloak:
         """
         attributes = {"account_expiration": expiration_datetime}
 
-        user = self.get_user(user_id=user_id)
+        # Never from the cache, the whole user is written back
+        user = self._fetch_user(user_id)
         user.attributes = attributes
         user.attributes.update(attributes)
         self.update_user(user)
@@ -1585,36 +2433,60 @@ class FastAPIKeycloak:
             bool: `True` si el usuario está temporalmente bloqueado, `False` en caso contrario.
 
         Raises:
-            KeycloakError: Si ocurre algún error al consultar los eventos en Keycloak.
-        """
-        # Construcción del URL para consultar los eventos del usuario
-        url = f"{self._admin_uri}/events"
-        headers = {"Authorization": f"Bearer {self.admin_token}"}
-        # headers = {"Content-Type": "application/x-www-form-urlencoded"}
-        params = {
-            "type": "LOGIN_ERROR",  # Filtrar solo eventos relacionados con errores de inicio de sesión
-            "userId": user_id,  # Especificar el ID del usuario
-        }
+            KeycloakError: Si ocurre algún error al consultar el estado en Keycloak.
 
-        # Realizar la solicitud a Keycloak
-        response = requests.get(
-            url, headers=headers, params=params, timeout=self.timeout
+        Notes:
+            - Se consulta el estado de la detección de fuerza bruta del usuario: una sola respuesta pequeña,
+              en lugar de descargar y recorrer todos sus eventos `LOGIN_ERROR`
+        """
+        response = self._admin_request(
+            url=f"{self._admin_uri}/attack-detection/brute-force/users/{user_id}",
+            method=HTTPMethod.GET,
         )
+        return self._temporarily_disabled_from_status(response)
+
+    @result_or_error()
+    async def is_user_temporarily_disabled_async(self, user_id: str) -> bool:
+        """
+        Versión asíncrona de `is_user_temporarily_disabled`.
+
+        Args:
+            user_id (str): El ID del usuario que se desea verificar.
+
+        Returns:
+            bool: `True` si el usuario está temporalmente bloqueado, `False` en caso contrario.
+
+        Raises:
+            KeycloakError: Si ocurre algún error al consultar el estado en Keycloak.
+        """
+        response = await self._admin_request_async(
+            url=f"{self._admin_uri}/attack-detection/brute-force/users/{user_id}",
+            method=HTTPMethod.GET,
+        )
+        return self._temporarily_disabled_from_status(response)
+
+    @staticmethod
+    def _temporarily_disabled_from_status(response: Response | httpx.Response) -> bool:
+        """
+        Lee el indicador `disabled` del estado de fuerza bruta de un usuario.
+
+        Args:
+            response (Response | httpx.Response): Respuesta de `attack-detection/brute-force/users/{id}`.
+
+        Returns:
+            bool: `True` si el usuario está temporalmente bloqueado, `False` en caso contrario.
+
+        Raises:
+            KeycloakError: Si la consulta del estado falló.
+        """
         # Manejar errores de la solicitud
         if response.status_code != 200:
             raise KeycloakError(
                 status_code=response.status_code,
-                reason=f"Error al consultar eventos de Keycloak: {response.content.decode('utf-8')}",
+                reason=f"Error al consultar el estado de fuerza bruta en Keycloak: {response.content.decode('utf-8')}",
             )
 
-        # Analizar la respuesta para buscar el error `user_temporarily_disabled`
-        events = response.json()
-        for event in events:
-            if event.get("error") == "user_temporarily_disabled":
-                return True  # El usuario está bloqueado temporalmente
-
-        # Si no se encontró el error, el usuario no está bloqueado
-        return False
+        return bool(orjson.loads(response.content).get("disabled", False))
 
     @result_or_error()
     def clear_login_error_events(self, user_id: str) -> dict:
@@ -1631,50 +2503,156 @@ class FastAPIKeycloak:
         Raises:
             KeycloakError: If an error occurs while trying to perform any of the operations.
         """
-        # Build the URL to delete login error events
-        events_url = f"{self._admin_uri}/events"
+        events_url, brute_force_url = self._login_error_urls(user_id)
 
-        # Configure the request parameters for login error events
-        events_params = {"type": "LOGIN_ERROR", "user": user_id}
+        # Both DELETE requests are independent of each other, only the second one is offloaded
+        brute_force_future = self._executor.submit(
+            self._admin_request, url=brute_force_url, method=HTTPMethod.DELETE
+        )
+        events_response = self._admin_request(url=events_url, method=HTTPMethod.DELETE)
+        self._check_login_errors_cleared(
+            events_response=events_response,
+            brute_force_response=brute_force_future.result(),
+        )
 
-        # Make the DELETE request to clear login error events
-        events_response = requests.delete(
-            events_url,
-            headers={"Authorization": f"Bearer {self.admin_token}"},
-            params=events_params,
+        # Enable the user with a partial update, a no-op for users that are enabled already
+        enable_response = self._admin_request(
+            url=f"{self.users_uri}/{user_id}",
+            data={"enabled": True},
+            method=HTTPMethod.PUT,
         )
+        self._evict_user(user_id)
+        if enable_response.status_code != 204:  # Not successful
+            raise _keycloak_error(enable_response)
 
-        if events_response.status_code != 204:  # Not successful
-            raise KeycloakError(
-                status_code=events_response.status_code,
-                reason=f"Error removing LOGIN_ERROR events: {events_response.content.decode('utf-8')}",
-            )
+        # Return confirmation message
+        return {
+            "message": f"LOGIN_ERROR events and brute force failures cleared, and user {user_id} unlocked."
+        }
+
+    @result_or_error()
+    async def clear_login_error_events_async(self, user_id: str) -> dict:
+        """
+        Asynchronous counterpart of `clear_login_error_events`. Both DELETE requests are awaited concurrently.
+
+        Args:
+            user_id (str): The ID of the user whose events and brute force failures should be removed.
+
+        Returns:
+            dict: Confirmation that the operations were successfully performed.
+
+        Raises:
+            KeycloakError: If an error occurs while trying to perform any of the operations.
+        """
+        await self._unlock_user_async(user_id, request=self._admin_request_async)
+        return {
+            "message": f"LOGIN_ERROR events and brute force failures cleared, and user {user_id} unlocked."
+        }
+
+    async def clear_login_error_events_bulk_async(self, user_ids: List[str]) -> dict:
+        """
+        Unlocks many users at once, like `clear_login_error_events` does for a single one. The requests of all
+        users are sent concurrently, at most `BULK_CONCURRENCY` of them at the same time.
+
+        Args:
+            user_ids (List[str]): The IDs of the users whose events and brute force failures should be removed.
+
+        Returns:
+            dict: The outcome per user ID, either "unlocked" or the error that prevented it.
+        """
+        semaphore = asyncio.Semaphore(BULK_CONCURRENCY)
+
+        async def request(**kwargs) -> httpx.Response:
+            async with semaphore:
+                return await self._admin_request_async(**kwargs)
+
+        user_ids = list(dict.fromkeys(user_ids))  # Every user is unlocked only once
+        results = await asyncio.gather(
+            *(
+                self._unlock_user_async(user_id, request=request)
+                for user_id in user_ids
+            ),
+            return_exceptions=True,
+        )
+        return {
+            user_id: "unlocked" if result is None else str(result)
+            for user_id, result in zip(user_ids, results)
+        }
+
+    async def _unlock_user_async(
+        self, user_id: str, request: Callable[..., Any]
+    ) -> None:
+        """
+        Clears the LOGIN_ERROR events and brute force failures of a user, both concurrently, and enables the user.
+
+        Args:
+            user_id (str): The ID of the user to unlock.
+            request (Callable[..., Any]): Coroutine function sending the admin requests, e.g. `_admin_request_async`.
+
+        Raises:
+            KeycloakError: If an error occurs while trying to perform any of the operations.
+        """
+        events_url, brute_force_url = self._login_error_urls(user_id)
+        events_response, brute_force_response = await asyncio.gather(
+            request(url=events_url, method=HTTPMethod.DELETE),
+            request(url=brute_force_url, method=HTTPMethod.DELETE),
+        )
+        self._check_login_errors_cleared(
+            events_response=events_response, brute_force_response=brute_force_response
+        )
+
+        enable_response = await request(
+            url=f"{self.users_uri}/{user_id}",
+            data={"enabled": True},
+            method=HTTPMethod.PUT,
+        )
+        self._evict_user(user_id)
+        if enable_response.status_code != 204:  # Not successful
+            raise _keycloak_error(enable_response)
 
-        # Build the URL to clear brute force failures
+    def _login_error_urls(self, user_id: str) -> tuple[str, str]:
+        """
+        Builds the URLs to delete the LOGIN_ERROR events and to clear the brute force failures of a user.
+
+        Args:
+            user_id (str): The ID of the user.
+
+        Returns:
+            tuple[str, str]: The events URL, including its query parameters, and the brute force URL.
+        """
+        events_url = f"{self._admin_uri}/events?" + urlencode(
+            {"type": "LOGIN_ERROR", "user": user_id}
+        )
         brute_force_url = (
             f"{self._admin_uri}/attack-detection/brute-force/users/{user_id}"
         )
+        return events_url, brute_force_url
 
-        # Make the DELETE request to clear brute force failures
-        brute_force_response = requests.delete(
-            brute_force_url, headers={"Authorization": f"Bearer {self.admin_token}"}
-        )
+    @staticmethod
+    def _check_login_errors_cleared(
+        events_response: Response | httpx.Response,
+        brute_force_response: Response | httpx.Response,
+    ) -> None:
+        """
+        Validates the responses of the DELETE requests issued by `clear_login_error_events`.
+
+        Args:
+            events_response (Response | httpx.Response): Response of the LOGIN_ERROR events DELETE.
+            brute_force_response (Response | httpx.Response): Response of the brute force DELETE.
 
-        if brute_force_response.status_code != 204:  # Not successful
+        Raises:
+            KeycloakError: If any of the requests was not successful. A 404 of the brute force DELETE counts as
+            success.
+        """
+        if events_response.status_code != 204:  # Not successful
             raise KeycloakError(
-                status_code=brute_force_response.status_code,
-                reason=f"Error clearing brute force failures: {brute_force_response.content.decode('utf-8')}",
+                status_code=events_response.status_code,
+                reason=f"Error removing LOGIN_ERROR events: {events_response.text}",
             )
 
-        # Fetch the user to ensure their status is updated
-        user = self.get_user(user_id=user_id)
-
-        # Enable the user if not already enabled
-        if not user.enabled:
-            user.enabled = True
-            self.update_user(user)
-
-        # Return confirmation message
-        return {
-            "message": f"LOGIN_ERROR events and brute force failures cleared, and user {user_id} unlocked."
-        }
+        # Nothing to clear is fine as well, an unknown user is still reported by the enabling update
+        if brute_force_response.status_code not in (204, 404):  # Not successful
+            raise KeycloakError(
+                status_code=brute_force_response.status_code,
+                reason=f"Error clearing brute force failures: {brute_force_response.text}",
+            )
@@ -1,9 +1,17 @@
+import asyncio
+import sys
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
 from typing import List
 
 import pytest as pytest
 from fastapi import HTTPException
+from jose import jwt
+from jose.exceptions import JWTClaimsError
 
-from fastapi_keycloak import KeycloakError
+from fastapi_keycloak import KeycloakError, api
+from fastapi_keycloak.api import _parse_expiration
 from fastapi_keycloak.exceptions import (
     ConfigureTOTPException,
     UpdatePasswordException,
@@ -294,6 +302,24 @@ class TestAPIFunctional(BaseTestClass):
         idp.delete_role("role_b")
         idp.delete_user(user.id)
 
+    def test_create_user_return_id(self, idp):
+        user_id = idp.create_user(
+            first_name="test",
+            last_name="user",
+            username="user@code-specialist.com",
+            email="user@code-specialist.com",
+            password=TEST_PASSWORD,
+            enabled=True,
+            send_email_verification=False,
+            return_full=False,
+        )
+        assert isinstance(user_id, str)
+
+        user: KeycloakUser = idp.get_user(user_id=user_id)
+        assert user.username == "user@code-specialist.com"
+
+        idp.delete_user(user_id)
+
     def test_groups(self, idp):
 
         # None of empty list groups
@@ -389,6 +415,24 @@ class TestAPIFunctional(BaseTestClass):
         idp.delete_group(group_id=bar_group.id)
         idp.delete_group(group_id=foo_group.id)
 
+    def test_get_subgroups_deep_tree(self, idp):
+        # Deeper than the recursion limit, the former recursive walk failed on such trees
+        depth = sys.getrecursionlimit() + 100
+        group = KeycloakGroup.construct(id="0", name="0", path="/0", subGroups=[])
+        root = group
+        for level in range(1, depth):
+            subgroup = KeycloakGroup.construct(
+                id=str(level),
+                name=str(level),
+                path=f"{group.path}/{level}",
+                subGroups=[],
+            )
+            group.subGroups.append(subgroup)
+            group = subgroup
+
+        assert idp.get_subgroups(root, group.path) is group
+        assert idp.get_subgroups(root, f"{group.path}/nonexistent") is None
+
     def test_user_groups(self, idp, user):
 
         # Check initial user groups
@@ -449,6 +493,175 @@ class TestAPIFunctional(BaseTestClass):
         # Clean up
         idp.delete_user(user_id=user.id)
 
+    @pytest.mark.parametrize(
+        "expiration",
+        ["2000-01-01T00:00:00", "2000-01-01T00:00:00Z", "2000-01-01T02:00:00+02:00"],
+    )
+    def test_parse_expiration(self, expiration):
+        # Dates without an UTC offset are taken as UTC, all of these denote the same instant
+        expected = datetime(2000, 1, 1, tzinfo=timezone.utc).timestamp()
+        assert _parse_expiration(expiration) == expected
+
+    @pytest.mark.parametrize(
+        "expiration, expired",
+        [
+            ("2000-01-01T00:00:00Z", True),
+            # Offset dates used to fail with a TypeError
+            ("2000-01-01T00:00:00+02:00", True),
+            ("2999-01-01T00:00:00-05:00", False),
+        ],
+    )
+    def test_login_account_expiration(self, idp, expiration, expired, user):
+        idp.set_account_expiration(user_id=user.id, expiration_datetime=expiration)
+
+        if expired:
+            with pytest.raises(HTTPException) as exc_info:
+                idp.user_login(username=user.username, password=TEST_PASSWORD)
+            assert exc_info.value.status_code == 403
+        else:
+            assert idp.user_login(username=user.username, password=TEST_PASSWORD)
+
+        # Clean up
+        idp.delete_user(user_id=user.id)
+
+    def test_user_login_async(self, idp, user):
+        async def login():
+            try:
+                return await idp.user_login_async(
+                    username=user.username, password=TEST_PASSWORD
+                )
+            finally:
+                await idp.close_async()
+
+        tokens = asyncio.run(login())
+        assert idp.token_is_valid(tokens["access_token"])
+        assert tokens["refresh_token"]
+
+        # Clean up
+        idp.delete_user(user_id=user.id)
+
+    def test_clear_login_error_events(self, idp, user):
+        # Any cached state of the user must not skip the unlock
+        idp.get_user(user_id=user.id)
+        user.enabled = False
+        idp.update_user(user=user)  # Lock the user
+
+        assert idp.clear_login_error_events(user_id=user.id)["message"]
+        assert idp.get_user(user_id=user.id).enabled  # Unlocked again
+
+        # Clean up
+        idp.delete_user(user_id=user.id)
+
+    def test_clear_login_error_events_async(self, idp, user):
+        user.enabled = False
+        idp.update_user(user=user)  # Lock the user
+
+        async def unlock():
+            try:
+                return await idp.clear_login_error_events_async(user_id=user.id)
+            finally:
+                await idp.close_async()
+
+        assert asyncio.run(unlock())["message"]
+        assert idp.get_user(user_id=user.id).enabled  # Unlocked again
+
+        # Clean up
+        idp.delete_user(user_id=user.id)
+
+    def test_clear_login_error_events_bulk_async(self, idp, user):
+        async def unlock():
+            try:
+                return await idp.clear_login_error_events_bulk_async(
+                    user_ids=[user.id, "abc"]
+                )
+            finally:
+                await idp.close_async()
+
+        results = asyncio.run(unlock())
+        assert results[user.id] == "unlocked"
+        # Non existent user, reported instead of raised
+        assert results["abc"] != "unlocked"
+
+        # Clean up
+        idp.delete_user(user_id=user.id)
+
+    def test_decode_token_cache(self, idp, user):
+        tokens = idp.user_login(username=user.username, password=TEST_PASSWORD)
+        access_token = tokens["access_token"]
+        decoded = idp._decode_token(token=access_token)
+
+        # A payload cached without an audience is not served for another audience
+        with pytest.raises(JWTClaimsError):
+            idp._decode_token(token=access_token, audience="some-other-client")
+
+        # Cached payloads are handed out as independent copies, nested claims included
+        decoded["realm_access"]["roles"].append("injected")
+        cached = idp._decode_token(token=access_token)
+        assert "injected" not in cached["realm_access"]["roles"]
+        cached["realm_access"]["roles"].append("injected")
+        cached = idp._decode_token(token=access_token)
+        assert "injected" not in cached["realm_access"]["roles"]
+
+        # Clean up
+        idp.delete_user(user_id=user.id)
+
+    def test_decode_token_cache_expiry(self, idp, user, monkeypatch):
+        tokens = idp.user_login(username=user.username, password=TEST_PASSWORD)
+        access_token = tokens["access_token"]
+        decoded = idp._decode_token(token=access_token)
+
+        jwt_decode = jwt.decode
+        calls = []
+
+        def decode(*args, **kwargs):
+            calls.append(1)
+            return jwt_decode(*args, **kwargs)
+
+        monkeypatch.setattr(jwt, "decode", decode)
+        idp._decode_token(token=access_token)
+        assert not calls  # Served from the cache
+
+        # From the expiry of the token on, the cached payload is not reused anymore
+        monkeypatch.setattr(api, "time", SimpleNamespace(time=lambda: decoded["exp"]))
+        idp._decode_token(token=access_token)
+        assert len(calls) == 1
+
+        # Clean up
+        idp.delete_user(user_id=user.id)
+
+    def test_signing_key_cache(self, idp, user, monkeypatch):
+        tokens = idp.user_login(username=user.username, password=TEST_PASSWORD)
+        access_token = tokens["access_token"]
+        kid = jwt.get_unverified_header(access_token)["kid"]
+        unknown = jwt.encode({}, "secret", headers={"kid": "some-unknown-kid"})
+
+        fetch_jwks = idp._fetch_jwks
+        fetches = []
+
+        def fetch():
+            fetches.append(1)
+            return fetch_jwks()
+
+        monkeypatch.setattr(idp, "_fetch_jwks", fetch)
+
+        # A kid miss triggers a fetch of the signing keys, later lookups hit the cache
+        idp._jwks.clear()
+        idp._jwks_fetched_at = 0.0
+        assert idp._signing_key(access_token) is idp._jwks[kid]
+        assert idp._signing_key(access_token) is idp._jwks[kid]
+        assert len(fetches) == 1
+
+        # Refetches for unknown key ids are rate limited
+        assert idp._signing_key(unknown) is idp._public_jwk
+        assert len(fetches) == 1
+        idp._jwks_fetched_at = time.time() - api.JWKS_REFRESH_INTERVAL - 1
+        assert idp._signing_key(unknown) is idp._public_jwk
+        assert idp._signing_key(unknown) is idp._public_jwk
+        assert len(fetches) == 2
+
+        # Clean up
+        idp.delete_user(user_id=user.id)
+
     def test_user_not_found_exception(self, idp):
         with pytest.raises(UserNotFound):  # Expect the get to fail due to a non existent user
             idp.get_user(user_id='abc')
@@ -1,3 +1,4 @@
+import asyncio
 from time import sleep
 from typing import List
 
@@ -5,7 +6,7 @@ import httpretty as httpretty
 import pytest as pytest
 from fastapi import FastAPI
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError
+from jose import JWTError, jwt
 from requests import ReadTimeout
 
 from fastapi_keycloak import HTTPMethod
@@ -59,6 +60,16 @@ class TestAPIIntegration(BaseTestClass):
         response = idp.proxy(relative_path="/realms/Test", method=HTTPMethod.GET)
         assert type(response.json()) == dict
 
+    def test_proxy_async(self, idp):
+        async def proxy():
+            try:
+                return await idp.proxy_async(relative_path="/realms/Test", method=HTTPMethod.GET)
+            finally:
+                await idp.close_async()
+
+        response = asyncio.run(proxy())
+        assert type(response.json()) == dict
+
     @httpretty.activate(allow_net_connect=False)
     def test_timeout(self, idp):
         def request_callback(request, url, headers):
@@ -71,6 +82,17 @@ class TestAPIIntegration(BaseTestClass):
         with pytest.raises(ReadTimeout):
             idp.proxy(relative_path="/timeout", method=HTTPMethod.GET)
 
+    def test_signing_key_fetch_failure(self, idp):
+        certs_uri = idp.open_id("certs")
+        token = jwt.encode({}, "secret", headers={"kid": "some-unknown-kid"})
+
+        # An error page instead of the signing keys makes the token invalid, it is not raised
+        with httpretty.enabled(allow_net_connect=False):
+            httpretty.register_uri(
+                httpretty.GET, certs_uri, status=503, body="<html>Unavailable</html>"
+            )
+            assert not idp.token_is_valid(token=token)
+
     def test_get_all_roles_and_get_roles(self, idp):
         roles: List[KeycloakRole] = idp.get_all_roles()
         assert roles